@@ -0,0 +1,82 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TtlCache:
+    """
+    Thread-safe least-recently-used cache whose entries expire after a given time to live.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.__maxsize = maxsize
+        self.__lock = threading.RLock()
+        self.__items: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns a cached value.
+
+        :param key: Cache key.
+
+        :return: Cached value, or None if the key is not cached or has expired.
+        """
+        with self.__lock:
+            try:
+                expires_at, value = self.__items[key]
+            except KeyError:
+                return None
+
+            if expires_at <= time.monotonic():
+                del self.__items[key]
+                return None
+
+            self.__items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Caches a value. The least recently used entry is evicted when the cache is full.
+
+        :param key: Cache key.
+        :param value: Value to cache.
+        :param ttl: Time to live in seconds. Nothing is cached if it is not positive.
+
+        :return: No return.
+        """
+        if ttl <= 0:
+            return
+
+        with self.__lock:
+            self.__items[key] = (time.monotonic() + ttl, value)
+            self.__items.move_to_end(key)
+
+            while len(self.__items) > self.__maxsize:
+                self.__items.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Removes a cached value if it exists.
+
+        :param key: Cache key.
+
+        :return: No return.
+        """
+        with self.__lock:
+            self.__items.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all cached values.
+
+        :return: No return.
+        """
+        with self.__lock:
+            self.__items.clear()
+
+
+# Process-wide caches.
+USER_CACHE = TtlCache()
+PERMISSION_CACHE = TtlCache()
+TOKEN_CACHE = TtlCache()
@@ -1,9 +1,14 @@
-from typing import Optional
+from functools import cached_property
+from typing import Any, Optional, TYPE_CHECKING
+
+import urllib3
 
-from authelio_sdk.client_group import ClientGroup
-from authelio_sdk.client_user import ClientUser
 from authelio_sdk.config import Config
 
+if TYPE_CHECKING:
+    from authelio_sdk.client_group import ClientGroup
+    from authelio_sdk.client_user import ClientUser
+
 
 class Client:
     def __init__(
@@ -15,11 +20,31 @@ class Client:
         self.api_key = api_key
         self.api_secret = api_secret
         self.config = config or Config.load()
+        # Connection pool shared by all sub-clients.
+        self.pool_manager = urllib3.PoolManager(maxsize=self.config.connection_pool_size)
+
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+
+        :return: No return.
+        """
+        self.pool_manager.clear()
+
+    @cached_property
+    def group(self) -> 'ClientGroup':
+        from authelio_sdk.client_group import ClientGroup
+
+        return ClientGroup(self.api_key, self.api_secret, self.config, self.pool_manager)
 
-    @property
-    def group(self) -> ClientGroup:
-        return ClientGroup(self.api_key, self.api_secret, self.config)
+    @cached_property
+    def user(self) -> 'ClientUser':
+        from authelio_sdk.client_user import ClientUser
 
-    @property
-    def user(self) -> ClientUser:
-        return ClientUser(self.api_key, self.api_secret, self.config)
+        return ClientUser(self.api_key, self.api_secret, self.config, self.pool_manager)
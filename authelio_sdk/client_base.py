@@ -1,9 +1,11 @@
-from typing import Optional, Any, Dict
+import hashlib
+from typing import Optional, Any, Dict, Hashable, Tuple
 
+import orjson
 import urllib3
-from b_lambda_layer_common.util.http_endpoint import HttpEndpoint
 
 from authelio_sdk.config import Config
+from authelio_sdk.http_endpoint import SdkHttpEndpoint
 
 
 class ClientBase:
@@ -11,23 +13,60 @@ class ClientBase:
             self,
             api_key: str,
             api_secret: str,
-            config: Config
+            config: Config,
+            pool_manager: Optional[urllib3.PoolManager] = None
     ) -> None:
         self.api_key = api_key
         self.api_secret = api_secret
         self.config = config
+        self.pool_manager = pool_manager or urllib3.PoolManager(maxsize=config.connection_pool_size)
+        # Only a pool created here is closed here.
+        self.__owns_pool_manager = pool_manager is None
+        self.__basic_auth_header = urllib3.make_headers(basic_auth=f'{api_key}:{api_secret}')
+        self.__credentials_digest = hashlib.sha256(f'{api_key}:{api_secret}'.encode()).hexdigest()
+        self.__default_headers = {
+            **self.__basic_auth_header,
+            **urllib3.make_headers(accept_encoding=True)
+        }
+
+    def __enter__(self) -> 'ClientBase':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections, if the pool was created by this client.
+        A pool given to the constructor is left for its owner to close.
+
+        :return: No return.
+        """
+        if self.__owns_pool_manager:
+            self.pool_manager.clear()
+
+    def _cache_key(self, key: Hashable) -> Tuple[Any, ...]:
+        """
+        Creates a key for process-wide caches, unique per API url and API credentials.
+
+        :param key: Key of the cached entry, e.g. user id.
+
+        :return: Cache key.
+        """
+        return self.config.public_api_url, self.api_key, self.__credentials_digest, key
 
     @property
     def basic_auth_header(self) -> Dict[str, str]:
-        return urllib3.make_headers(basic_auth=f'{self.api_key}:{self.api_secret}')
+        return dict(self.__basic_auth_header)
 
     def http_endpoint(
             self,
             path: str,
             method: str = 'GET',
             body: Any = None,
-            fields: Optional[Any] = None
-    ) -> HttpEndpoint:
+            fields: Optional[Any] = None,
+            redirect: bool = True
+    ) -> SdkHttpEndpoint:
         """
         Calls endpoint with given HTTP method and path.
 
@@ -35,13 +74,22 @@ class ClientBase:
         :param method: HTTP method, e.g. POST, GET, etc.
         :param body: Body of an HTTP request.
         :param fields: HTTP query parameters.
+        :param redirect: Whether to follow redirects.
 
         :return: HTTP response object.
         """
-        return HttpEndpoint(
+        headers = dict(self.__default_headers)
+
+        if isinstance(body, (dict, list, tuple)):
+            body = orjson.dumps(body)
+            headers['Content-Type'] = 'application/json'
+
+        return SdkHttpEndpoint(
             endpoint_url=f'{self.config.public_api_url}{path}',
             method=method,
             body=body,
             fields=fields,
-            headers=self.basic_auth_header
+            headers=headers,
+            pool_manager=self.pool_manager,
+            redirect=redirect
         )
@@ -1,24 +1,35 @@
 from typing import Any, Dict, Optional, List, Tuple
 
+import urllib3
+
+from authelio_sdk.cache import USER_CACHE, PERMISSION_CACHE
 from authelio_sdk.client_base import ClientBase
 from authelio_sdk.config import Config
 from authelio_sdk.models.group import Group
 
 
 class ClientGroup(ClientBase):
+    __GROUP_GET_PATH = '/group/get'
+    __GROUP_DELETE_PATH = '/group/delete'
+    __GROUP_CREATE_PATH = '/group/create'
+    __GROUP_FILTER_PATH = '/group/filter'
+    __GROUP_UPDATE_PATH = '/group/update'
+    __GROUP_USERS_PATH = '/group/users'
+
     def __init__(
             self,
             api_key: str,
             api_secret: str,
-            config: Config
+            config: Config,
+            pool_manager: Optional[urllib3.PoolManager] = None
     ) -> None:
-        super().__init__(api_key, api_secret, config)
+        super().__init__(api_key, api_secret, config, pool_manager)
 
     def get(self, *group_ids: str) -> Dict[str, Group]:
         parameters = [('group_id', group_id) for group_id in group_ids]
         groups_data = self.http_endpoint(
-            path='/group/get',
-            method='GET',
+            self.__GROUP_GET_PATH,
+            'GET',
             fields=parameters
         ).call_to_json()
 
@@ -33,13 +44,17 @@ class ClientGroup(ClientBase):
 
     def delete(self, group_id: str) -> None:
         self.http_endpoint(
-            path='/group/delete',
-            method='DELETE',
+            self.__GROUP_DELETE_PATH,
+            'DELETE',
             body={
                 'group_id': group_id
             }
         ).call_to_response()
 
+        # Group membership and permissions of users might have changed.
+        USER_CACHE.clear()
+        PERMISSION_CACHE.clear()
+
     def create(self, group_name: str, permissions: List[str], group_id: Optional[str] = None) -> Group:
         body = {
             'group_name': group_name,
@@ -50,8 +65,8 @@ class ClientGroup(ClientBase):
             body['group_id'] = group_id
 
         group_json = self.http_endpoint(
-            path='/group/create',
-            method='POST',
+            self.__GROUP_CREATE_PATH,
+            'POST',
             body=body
         ).call_to_json()
 
@@ -73,8 +88,8 @@ class ClientGroup(ClientBase):
         parameters = {key: value for key, value in parameters.items() if value is not None}
 
         groups_json: Dict[str, Any] = self.http_endpoint(
-            path='/group/filter',
-            method='GET',
+            self.__GROUP_FILTER_PATH,
+            'GET',
             fields=parameters
         ).call_to_json()
 
@@ -97,16 +112,19 @@ class ClientGroup(ClientBase):
         body = {key: value for key, value in body.items() if value is not None}
 
         self.http_endpoint(
-            path='/group/update',
-            method='PUT',
+            self.__GROUP_UPDATE_PATH,
+            'PUT',
             body=body
         ).call_to_response()
 
+        # Permissions of group users might have changed.
+        PERMISSION_CACHE.clear()
+
     def users(self, *group_ids: str) -> List[str]:
         parameters = [('group_id', group_id) for group_id in group_ids]
 
         return self.http_endpoint(
-            path='/group/users',
-            method='GET',
+            self.__GROUP_USERS_PATH,
+            'GET',
             fields=parameters
         ).call_to_json()['users']
@@ -1,32 +1,71 @@
-from typing import Optional, List, Dict, Tuple
+import base64
+import copy
+import hashlib
+import time
+from typing import Any, Optional, List, Dict, Tuple
+from urllib.parse import urlencode
 
-from b_lambda_layer_common.util.http_endpoint import HttpCall
+import orjson
+import urllib3
 
+from authelio_sdk.cache import USER_CACHE, PERMISSION_CACHE, TOKEN_CACHE
 from authelio_sdk.client_base import ClientBase
 from authelio_sdk.config import Config
 from authelio_sdk.models.token import Token
 from authelio_sdk.models.user import User
+from authelio_sdk.models.user_table import UserTable
 
 
 class ClientUser(ClientBase):
+    __USER_GET_PATH = '/user/get'
+    __USER_DELETE_PATH = '/user/delete'
+    __USER_CREATE_PATH = '/user/create'
+    __USER_ENABLE_PATH = '/user/enable'
+    __USER_DISABLE_PATH = '/user/disable'
+    __USER_UPDATE_PATH = '/user/update'
+    __USER_FILTER_PATH = '/user/filter'
+    __TOKEN_CREATE_PATH = '/token/create'
+    __TOKEN_CHALLENGE_PATH = '/token/challenge'
+    __TOKEN_VALIDATE_PATH = '/token/validate'
+    __TOKEN_REFRESH_PATH = '/token/refresh'
+    __PERMISSION_GET_PATH = '/permission/get'
+    __LOGIN_PATH = '/login'
+
     def __init__(
             self,
             api_key: str,
             api_secret: str,
-            config: Config
+            config: Config,
+            pool_manager: Optional[urllib3.PoolManager] = None
     ) -> None:
-        super().__init__(api_key, api_secret, config)
+        super().__init__(api_key, api_secret, config, pool_manager)
 
     def get(self, *user_ids: str) -> Dict[str, User]:
-        parameters = [('user_id', user_id) for user_id in user_ids]
+        caching = self.config.user_cache_ttl > 0
+        # Duplicates are dropped, order is preserved.
+        unique_user_ids = list(dict.fromkeys(user_ids))
+        cached_users: Dict[str, User] = {}
+        missing_user_ids: List[str] = []
+
+        for user_id in unique_user_ids:
+            user = USER_CACHE.get(self._cache_key(user_id)) if caching else None
+            if user is None:
+                missing_user_ids.append(user_id)
+            else:
+                cached_users[user_id] = copy.deepcopy(user)
+
+        if user_ids and not missing_user_ids:
+            return cached_users
+
+        query = urlencode({'user_id': missing_user_ids}, doseq=True)
         users_data = self.http_endpoint(
-            path='/user/get',
-            method='GET',
-            fields=parameters
+            f'{self.__USER_GET_PATH}?{query}' if query else self.__USER_GET_PATH,
+            'GET'
         ).call_to_json()
 
-        return {
-            user_id: User(
+        fetched_users: Dict[str, User] = {}
+        for user_id, user in users_data.items():
+            fetched_users[user_id] = User(
                 # Unique identifiers.
                 user_id=user['user_id'],
                 username=user['username'],
@@ -40,18 +79,31 @@ class ClientUser(ClientBase):
                 direct_permissions=user['direct_permissions'],
                 group_ids=user['group_ids']
             )
-            for user_id, user in users_data.items()
-        }
+
+            if caching:
+                USER_CACHE.set(self._cache_key(user_id), copy.deepcopy(fetched_users[user_id]), self.config.user_cache_ttl)
+
+        # Users are returned in the order of the given ids.
+        users: Dict[str, User] = {}
+        for user_id in unique_user_ids:
+            user = cached_users.get(user_id) or fetched_users.get(user_id)
+            if user is not None:
+                users[user_id] = user
+        users.update(fetched_users)
+
+        return users
 
     def delete(self, user_id: str) -> None:
         self.http_endpoint(
-            path='/user/delete',
-            method='DELETE',
+            self.__USER_DELETE_PATH,
+            'DELETE',
             body={
                 'user_id': user_id,
             }
         ).call_to_response()
 
+        self.__invalidate(user_id, tokens=True)
+
     def create(
             self,
             email: str,
@@ -78,8 +130,8 @@ class ClientUser(ClientBase):
         if direct_permissions: body.update(direct_permissions=direct_permissions)
 
         user_json = self.http_endpoint(
-            path='/user/create',
-            method='POST',
+            self.__USER_CREATE_PATH,
+            'POST',
             body=body
         ).call_to_json()
 
@@ -97,22 +149,26 @@ class ClientUser(ClientBase):
 
     def enable(self, user_id: str) -> None:
         self.http_endpoint(
-            path='/user/enable',
-            method='POST',
+            self.__USER_ENABLE_PATH,
+            'POST',
             body={
                 'user_id': user_id
             }
         ).call_to_response()
 
+        self.__invalidate(user_id)
+
     def disable(self, user_id: str) -> None:
         self.http_endpoint(
-            path='/user/disable',
-            method='POST',
+            self.__USER_DISABLE_PATH,
+            'POST',
             body={
                 'user_id': user_id
             }
         ).call_to_response()
 
+        self.__invalidate(user_id, tokens=True)
+
     def update(
             self,
             user_id: str,
@@ -124,40 +180,32 @@ class ClientUser(ClientBase):
             direct_permissions: Optional[List[str]] = None
     ) -> None:
         body = {
-            'user_id': user_id,
-            'email': email,
-            'username': username,
-            'first_name': first_name,
-            'last_name': last_name,
-            'group_ids': group_ids,
-            'direct_permissions': direct_permissions
+            key: value for key, value in (
+                ('email', email),
+                ('username', username),
+                ('first_name', first_name),
+                ('last_name', last_name),
+                ('group_ids', group_ids),
+                ('direct_permissions', direct_permissions)
+            ) if value is not None
         }
-        body = {key: value for key, value in body.items() if value is not None}
+        body['user_id'] = user_id
 
         self.http_endpoint(
-            path='/user/update',
-            method='PUT',
+            self.__USER_UPDATE_PATH,
+            'PUT',
             body=body
         ).call_to_response()
 
+        self.__invalidate(user_id)
+
     def filter(
             self,
             is_active: Optional[bool] = None,
             count: Optional[int] = None,
             page_id: Optional[str] = None
     ) -> Tuple[Dict[str, User], str]:
-        parameters = {
-            'is_active': is_active,
-            'count': count,
-            'page_id': page_id
-        }
-        parameters = {key: value for key, value in parameters.items() if value is not None}
-
-        response_body_json = self.http_endpoint(
-            path='/user/filter',
-            method='GET',
-            fields=parameters
-        ).call_to_json()
+        response_body_json = self.__filter(is_active, count, page_id)
 
         users = {
             user_id: User(
@@ -174,10 +222,51 @@ class ClientUser(ClientBase):
 
         return users, response_body_json['next_page_id']
 
+    def filter_columnar(
+            self,
+            is_active: Optional[bool] = None,
+            count: Optional[int] = None,
+            page_id: Optional[str] = None
+    ) -> Tuple[UserTable, str]:
+        """
+        Same as filter, but returns users as a single column-oriented table
+        instead of creating a separate object for every user.
+
+        :return: Table of filtered users and next page token.
+        """
+        response_body_json = self.__filter(is_active, count, page_id)
+
+        table = UserTable()
+        for user in response_body_json['results'].values():
+            table.user_ids.append(user['user_id'])
+            table.usernames.append(user['username'])
+            table.emails.append(user['email'])
+            table.first_names.append(user['first_name'])
+            table.last_names.append(user['last_name'])
+            table.group_ids.append(user['group_ids'])
+            table.direct_permissions.append(user['direct_permissions'])
+
+        return table, response_body_json['next_page_id']
+
+    def filter_ids(
+            self,
+            is_active: Optional[bool] = None,
+            count: Optional[int] = None,
+            page_id: Optional[str] = None
+    ) -> Tuple[List[str], str]:
+        """
+        Same as filter, but returns only user ids.
+
+        :return: Ids of filtered users and next page token.
+        """
+        response_body_json = self.__filter(is_active, count, page_id)
+
+        return list(response_body_json['results']), response_body_json['next_page_id']
+
     def confirm(self, username: str, tmp_password: str, new_password: str) -> None:
         token_json = self.http_endpoint(
-            path='/token/create',
-            method='POST',
+            self.__TOKEN_CREATE_PATH,
+            'POST',
             body={
                 'username': username,
                 'password': tmp_password
@@ -186,8 +275,8 @@ class ClientUser(ClientBase):
 
         if token_json['is_challenge'] is True:
             token_json = self.http_endpoint(
-                path='/token/challenge',
-                method='POST',
+                self.__TOKEN_CHALLENGE_PATH,
+                'POST',
                 body={
                     'challenge_name': token_json['challenge']['challenge_name'],
                     'challenge_session': token_json['challenge']['session'],
@@ -198,10 +287,7 @@ class ClientUser(ClientBase):
                 }
             ).call_to_json()
 
-        try:
-            access_token = token_json['authentication']['access_token']
-        except (KeyError, ValueError):
-            access_token = None
+        access_token = (token_json.get('authentication') or {}).get('access_token')
 
         if not access_token:
             raise ValueError(
@@ -211,20 +297,32 @@ class ClientUser(ClientBase):
             )
 
     def validate_token(self, access_token: str) -> bool:
+        caching = self.config.token_cache_ttl > 0
+
+        if caching:
+            # Tokens are cached by their hash.
+            cache_key = self._cache_key(hashlib.sha256(access_token.encode()).hexdigest())
+            if TOKEN_CACHE.get(cache_key):
+                return True
+
         response = self.http_endpoint(
-            path='/token/validate',
-            method='POST',
+            self.__TOKEN_VALIDATE_PATH,
+            'POST',
             body={
                 'access_token': access_token
             }
         ).call_to_json()
 
+        # Only positive results are cached.
+        if caching and response['valid'] is True:
+            TOKEN_CACHE.set(cache_key, True, self.__token_cache_ttl(access_token))
+
         return response['valid']
 
     def create_token(self, username: str, password: str) -> Token:
         token_json = self.http_endpoint(
-            path='/token/create',
-            method='POST',
+            self.__TOKEN_CREATE_PATH,
+            'POST',
             body={
                 'username': username,
                 'password': password
@@ -238,55 +336,128 @@ class ClientUser(ClientBase):
                 f'Hint: to confirm user, call "{ClientUser.__name__}.{ClientUser.confirm.__name__}" method.'
             )
 
-        return Token(**token_json['authentication'])
+        return self.__token(token_json['authentication'])
 
     def exchange_auth_code(self, authorization_code: str, redirect_uri: Optional[str] = None) -> Token:
         token_json = self.http_endpoint(
-            path='/token/create',
-            method='POST',
+            self.__TOKEN_CREATE_PATH,
+            'POST',
             body={
                 'authorization_code': authorization_code,
                 'redirect_uri': redirect_uri
             }
         ).call_to_json()
 
-        return Token(**token_json['authentication'])
+        return self.__token(token_json['authentication'])
 
     def refresh_token(self, refresh_token: str) -> Token:
         token_json = self.http_endpoint(
-            path='/token/refresh',
-            method='POST',
+            self.__TOKEN_REFRESH_PATH,
+            'POST',
             body={
                 'refresh_token': refresh_token
             }
         ).call_to_json()
 
-        return Token(**token_json)
+        return self.__token(token_json)
 
     def permissions(self, user_id: str) -> List[str]:
+        caching = self.config.user_cache_ttl > 0
+
+        if caching:
+            permissions = PERMISSION_CACHE.get(self._cache_key(user_id))
+            if permissions is not None:
+                return list(permissions)
+
         permissions = self.http_endpoint(
-            path='/permission/get',
-            method='GET',
+            self.__PERMISSION_GET_PATH,
+            'GET',
             fields={
                 'user_id': user_id
             }
-        ).call_to_json()
+        ).call_to_json()['permissions']
 
-        return permissions['permissions']
+        if caching:
+            PERMISSION_CACHE.set(self._cache_key(user_id), list(permissions), self.config.user_cache_ttl)
+
+        return permissions
 
     def login(self, redirect_uri: Optional[str] = None, response_type: Optional[str] = None) -> str:
         parameters = {
-            'redirect_uri': redirect_uri,
-            'response_type': response_type
+            key: value for key, value in (
+                ('redirect_uri', redirect_uri),
+                ('response_type', response_type)
+            ) if value is not None
         }
-        parameters = {key: value for key, value in parameters.items() if value is not None}
 
-        response = HttpCall.call(
-            method='GET',
-            url=f'{self.config.public_api_url}/login',
+        response = self.http_endpoint(
+            self.__LOGIN_PATH,
+            'GET',
             fields=parameters,
-            headers=self.basic_auth_header,
             redirect=False
-        )
+        ).call_to_response()
 
         return response.headers['location']
+
+    def __invalidate(self, user_id: str, tokens: bool = False) -> None:
+        """
+        Removes cached data of the given user.
+
+        :param user_id: Id of a changed user.
+        :param tokens: Whether to drop all cached token validation results too.
+
+        :return: No return.
+        """
+        USER_CACHE.pop(self._cache_key(user_id))
+        PERMISSION_CACHE.pop(self._cache_key(user_id))
+
+        if tokens:
+            TOKEN_CACHE.clear()
+
+    def __filter(
+            self,
+            is_active: Optional[bool] = None,
+            count: Optional[int] = None,
+            page_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        parameters = {
+            key: value for key, value in (
+                ('is_active', is_active),
+                ('count', count),
+                ('page_id', page_id)
+            ) if value is not None
+        }
+
+        return self.http_endpoint(
+            self.__USER_FILTER_PATH,
+            'GET',
+            fields=parameters
+        ).call_to_json()
+
+    @staticmethod
+    def __token(token_json: Dict[str, Any]) -> Token:
+        return Token(
+            token_type=token_json['token_type'],
+            id_token=token_json['id_token'],
+            expires_in=token_json['expires_in'],
+            access_token=token_json['access_token'],
+            refresh_token=token_json.get('refresh_token')
+        )
+
+    def __token_cache_ttl(self, access_token: str) -> float:
+        """
+        Calculates for how long a positive validation result of the given access token can be cached.
+        The result is never cached longer than the token is valid.
+
+        :param access_token: JWT access token.
+
+        :return: Time to live in seconds, or 0 if the token expiry can not be read.
+        """
+        try:
+            payload = access_token.split('.')[1]
+            claims = orjson.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+            expires_in = float(claims['exp']) - time.time()
+        except (IndexError, KeyError, TypeError, ValueError):
+            return 0
+
+        return min(self.config.token_cache_ttl, expires_in)
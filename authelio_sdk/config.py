@@ -11,10 +11,29 @@ class Config:
     def __init__(
             self,
             public_api_url: Optional[str] = None,
-            private_api_url: Optional[str] = None
-    ):
+            private_api_url: Optional[str] = None,
+            user_cache_ttl: float = 0,
+            token_cache_ttl: float = 0,
+            connection_pool_size: int = 10
+    ) -> None:
+        """
+        Constructor.
+
+        :param public_api_url: Url of the public Authelio API.
+        :param private_api_url: Url of the private Authelio API.
+        :param user_cache_ttl: Seconds to cache users and permissions retrieved by the SDK.
+            Caching is disabled by default.
+        :param token_cache_ttl: Seconds to cache positive access token validation results.
+            Caching is disabled by default. Results are never cached longer than the token is valid.
+            Note, that a revoked token stays valid in the cache until the cached result expires.
+        :param connection_pool_size: Number of connections kept alive to the API. Calls made
+            concurrently from more threads than that open short-lived extra connections.
+        """
         self.public_api_url = public_api_url
         self.private_api_url = private_api_url
+        self.user_cache_ttl = user_cache_ttl
+        self.token_cache_ttl = token_cache_ttl
+        self.connection_pool_size = connection_pool_size
 
     @staticmethod
     def load() -> 'Config':
@@ -0,0 +1,149 @@
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Union, Iterable, AnyStr
+
+import orjson
+import urllib3
+from b_lambda_layer_common.exceptions.container.internal_error import InternalError
+from b_lambda_layer_common.exceptions.container.not_reached_error import NotReachedError
+from b_lambda_layer_common.exceptions.exception_mapper import ExceptionMapper
+from b_lambda_layer_common.util.http_call import HttpCall
+from b_lambda_layer_common.util.http_endpoint import HttpEndpoint
+from urllib3 import HTTPResponse
+from urllib3.exceptions import HTTPError
+from urllib3.util.retry import Retry
+
+
+class SdkHttpEndpoint(HttpEndpoint):
+    """
+    Http endpoint that parses JSON responses with orjson and respects
+    rate limiting hints of the API when retrying throttled calls.
+    """
+
+    def __init__(
+            self,
+            endpoint_url: str,
+            method: str,
+            body: Optional[Union[Dict[Any, Any], Iterable[Any], AnyStr]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            fields: Optional[Any] = None,
+            pool_manager: Optional[urllib3.PoolManager] = None,
+            redirect: bool = True
+    ) -> None:
+        """
+        Constructor.
+
+        :param endpoint_url: Full endpoint url to call.
+        :param method: Http request method type.
+        :param body: Body to include in request.
+        :param headers: Headers to include in request.
+        :param fields: Query parameters or request body fields.
+        :param pool_manager: Connection pool to send the request through.
+        :param redirect: Whether to follow redirects.
+        """
+        super().__init__(endpoint_url, method, body, headers, fields)
+
+        self.__pool_manager = pool_manager
+        self.__redirect = redirect
+
+    def call_to_json(self) -> Dict[str, Any]:
+        """
+        Calls a specified endpoint with specified parameters.
+
+        :return: Http response represented as dictionary.
+        """
+        data = self._call().data
+
+        if data == b'':
+            return {}
+
+        return orjson.loads(data)
+
+    def _call(self) -> HTTPResponse:
+        """
+        Initiates a call to a specified endpoint with specified parameters.
+
+        Retries with an exponential backoff on 429 and 5xx responses. If the API
+        tells how long to wait (Retry-After header), the next attempt is delayed at
+        least that long, up to the maximum single wait, without using up the
+        remaining attempts.
+
+        :return: Http response object.
+        """
+        http = self.__pool_manager or urllib3.PoolManager()
+
+        wait_length = HttpCall.INITIAL_WAIT_TIME
+        last_exception = None
+        while True:
+            response: Optional[HTTPResponse] = None
+            try:
+                try:
+                    response = http.request(
+                        method=self.http_method,
+                        url=self.endpoint_url,
+                        fields=self.fields,
+                        headers=self.headers,
+                        body=self.http_body,
+                        redirect=self.__redirect,
+                        # Throttled responses are retried below, not by urllib3.
+                        retries=Retry(3, respect_retry_after_header=False)
+                    )
+                except HTTPError as ex:
+                    raise NotReachedError(str(ex))
+                if HttpCall.is_status_repeatable(response.status):
+                    self.__map_and_raise(response)
+            except Exception as ex:
+                # Store the last exception thrown to rethrow at a later point.
+                last_exception = ex
+                delay = wait_length
+                if response is not None:
+                    delay = min(max(delay, self.__retry_after(response)), HttpCall.MAXIMUM_SINGLE_WAIT)
+                wait_length *= HttpCall.WAIT_EXPONENTIATION_FACTOR
+                # No attempts left.
+                if wait_length > HttpCall.MAXIMUM_SINGLE_WAIT:
+                    break
+                time.sleep(delay)
+            else:
+                # Successful request.
+                if 400 <= response.status <= 599:
+                    self.__map_and_raise(response)
+                return response
+        # Retry attempts exceeded, raise the last exception.
+        raise last_exception
+
+    @staticmethod
+    def __map_and_raise(response: HTTPResponse) -> None:
+        try:
+            ExceptionMapper.map_and_raise(orjson.loads(response.data))
+        except ValueError:
+            raise InternalError(f'Http call failed with status: {response.status}.')
+
+    @staticmethod
+    def __retry_after(response: HTTPResponse) -> float:
+        """
+        Reads the delay requested by the API from the Retry-After header,
+        given either in seconds or as an HTTP date.
+
+        :param response: Throttled or failed http response.
+
+        :return: Delay in seconds, or 0 if the API did not specify it.
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return 0.0
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
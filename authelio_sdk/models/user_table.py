@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Optional, List
+
+
+@dataclass
+class UserTable:
+    """
+    Column-oriented collection of users. Values of the same index belong to the same user.
+    """
+    user_ids: List[str] = field(default_factory=lambda: [])
+    usernames: List[str] = field(default_factory=lambda: [])
+    emails: List[str] = field(default_factory=lambda: [])
+    first_names: List[str] = field(default_factory=lambda: [])
+    last_names: List[str] = field(default_factory=lambda: [])
+    group_ids: List[Optional[List[str]]] = field(default_factory=lambda: [])
+    direct_permissions: List[Optional[List[str]]] = field(default_factory=lambda: [])
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
@@ -1,9 +1,8 @@
 from unittest.mock import patch, MagicMock
 from uuid import uuid4
 
-from b_lambda_layer_common.util.http_endpoint import HttpEndpoint
-
 from authelio_sdk.client import Client
+from authelio_sdk.http_endpoint import SdkHttpEndpoint
 from authelio_sdk.models.user import User
 
 
@@ -26,7 +25,7 @@ def test_FUNC_client_user_create_token_WITH_username_password_EXPECT_token_creat
     assert valid
 
 
-@patch.object(HttpEndpoint, 'call_to_json')
+@patch.object(SdkHttpEndpoint, 'call_to_json')
 def test_FUNC_client_user_exchange_auth_code_WITH_authorization_code_EXPECT_token_created(
         http_endpoint_mock: MagicMock,
         sdk_client: Client,
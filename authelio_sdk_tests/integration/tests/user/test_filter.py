@@ -30,3 +30,54 @@ def test_FUNC_client_user_filter_WITH_many_users_to_filter_all_EXPECT_users_foun
     for username in users:
         assert user_data[username].user_id == username
         assert sorted(user_data[username].direct_permissions) == sorted(direct_permissions)
+
+
+def test_FUNC_client_user_filter_columnar_WITH_many_users_to_filter_all_EXPECT_users_found(
+        sdk_client: Client,
+        user_function: Callable[..., User],
+        faker: Faker
+) -> None:
+    """
+    Check whether all users can be retrieved as a column-oriented table.
+
+    :param sdk_client: SDK client.
+    :param user_function: User fixture.
+
+    :return: No return.
+    """
+    # Create some random users.
+    direct_permissions = [faker.unique.word() for _ in range(3)]
+    users = [user_function(direct_permissions=direct_permissions) for _ in range(5)]
+
+    # Try to filter all users.
+    user_table, next_page_id = sdk_client.user.filter_columnar()
+
+    # Check that all users were found.
+    for user in users:
+        index = user_table.user_ids.index(user.user_id)
+        assert user_table.usernames[index] == user.username
+        assert user_table.emails[index] == user.email
+        assert sorted(user_table.direct_permissions[index]) == sorted(direct_permissions)
+
+
+def test_FUNC_client_user_filter_ids_WITH_many_users_to_filter_all_EXPECT_user_ids_found(
+        sdk_client: Client,
+        user_function: Callable[..., User]
+) -> None:
+    """
+    Check whether ids of all users can be retrieved.
+
+    :param sdk_client: SDK client.
+    :param user_function: User fixture.
+
+    :return: No return.
+    """
+    # Create some random users.
+    users = [user_function().user_id for _ in range(5)]
+
+    # Try to filter all user ids.
+    user_ids, next_page_id = sdk_client.user.filter_ids()
+
+    # Check that all users were found.
+    for user_id in users:
+        assert user_id in user_ids
@@ -0,0 +1,22 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+from authelio_sdk.cache import USER_CACHE, PERMISSION_CACHE, TOKEN_CACHE
+
+# Import all fixtures.
+# noinspection PyUnresolvedReferences
+from authelio_sdk_tests.unit.fixtures import *
+
+
+@pytest.fixture(scope='function', autouse=True)
+def clear_caches():
+    """
+    Fixture that clears process-wide caches after test run.
+
+    :return: No return.
+    """
+    yield
+
+    USER_CACHE.clear()
+    PERMISSION_CACHE.clear()
+    TOKEN_CACHE.clear()
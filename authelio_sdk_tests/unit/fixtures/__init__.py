@@ -0,0 +1 @@
+from authelio_sdk_tests.unit.fixtures.stub_server import *
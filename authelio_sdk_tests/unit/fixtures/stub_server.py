@@ -0,0 +1,107 @@
+import json
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from pytest import fixture
+
+
+@dataclass
+class StubRequest:
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    body: Optional[Any] = None
+
+
+@dataclass
+class StubResponse:
+    status: int = 200
+    body: Optional[Any] = None
+    headers: Dict[str, str] = field(default_factory=lambda: {})
+
+
+class StubServer:
+    """
+    Local HTTP server imitating the Authelio API.
+    Every route is a function that receives a request and returns a response.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[StubRequest] = []
+        self.routes: Dict[Tuple[str, str], Callable[[StubRequest], StubResponse]] = {}
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def handle_request(self) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get('Content-Length') or 0)
+                data = self.rfile.read(length)
+
+                request = StubRequest(
+                    method=self.command,
+                    path=url.path,
+                    query=parse_qs(url.query),
+                    body=json.loads(data) if data else None
+                )
+                stub.requests.append(request)
+
+                route = stub.routes.get((request.method, request.path))
+                response = route(request) if route else StubResponse(status=404, body={})
+                response_data = b'' if response.body is None else json.dumps(response.body).encode()
+
+                self.send_response(response.status)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response_data)))
+                self.end_headers()
+                self.wfile.write(response_data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.__thread = threading.Thread(target=self.__server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address
+        return f'http://{host}:{port}'
+
+    def route(self, method: str, path: str, handler: Callable[[StubRequest], StubResponse]) -> None:
+        self.routes[(method, path)] = handler
+
+    def calls(self, path: str) -> int:
+        return len([request for request in self.requests if request.path == path])
+
+    def start(self) -> None:
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+
+@fixture(scope='function')
+def stub_server() -> StubServer:
+    """
+    Fixture that starts a local stub of the Authelio API.
+
+    The server is stopped after test run.
+
+    :return: Returns a running stub server without any routes.
+    """
+    server = StubServer()
+    server.start()
+
+    yield server
+
+    server.stop()
@@ -0,0 +1,84 @@
+import pytest
+
+from authelio_sdk.cache import TtlCache
+
+
+@pytest.fixture(scope='function')
+def clock(monkeypatch: pytest.MonkeyPatch) -> list:
+    """
+    Fixture that replaces the monotonic clock used by the cache with a manually moved one.
+
+    :return: Returns a single element list holding the current time in seconds.
+    """
+    now = [1000.0]
+    monkeypatch.setattr('authelio_sdk.cache.time.monotonic', lambda: now[0])
+
+    return now
+
+
+def test_FUNC_ttl_cache_get_WITH_expired_entry_EXPECT_none(clock: list) -> None:
+    """
+    Check whether entries expire after their time to live.
+
+    :param clock: Clock fixture.
+
+    :return: No return.
+    """
+    cache = TtlCache()
+    cache.set('key', 'value', ttl=10)
+
+    clock[0] += 9.9
+    assert cache.get('key') == 'value'
+
+    clock[0] += 0.1
+    assert cache.get('key') is None
+
+
+def test_FUNC_ttl_cache_set_WITH_not_positive_ttl_EXPECT_nothing_cached() -> None:
+    """
+    Check whether nothing is cached when time to live is not positive.
+
+    :return: No return.
+    """
+    cache = TtlCache()
+    cache.set('key', 'value', ttl=0)
+
+    assert cache.get('key') is None
+
+
+def test_FUNC_ttl_cache_set_WITH_full_cache_EXPECT_least_recently_used_evicted() -> None:
+    """
+    Check whether the least recently used entry is evicted when the cache is full.
+
+    :return: No return.
+    """
+    cache = TtlCache(maxsize=2)
+    cache.set('a', 1, ttl=60)
+    cache.set('b', 2, ttl=60)
+
+    # Reading makes "a" the most recently used entry.
+    assert cache.get('a') == 1
+
+    cache.set('c', 3, ttl=60)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_FUNC_ttl_cache_pop_and_clear_WITH_cached_entries_EXPECT_entries_removed() -> None:
+    """
+    Check whether entries can be removed one by one and all at once.
+
+    :return: No return.
+    """
+    cache = TtlCache()
+    cache.set('a', 1, ttl=60)
+    cache.set('b', 2, ttl=60)
+
+    cache.pop('a')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.clear()
+    assert cache.get('b') is None
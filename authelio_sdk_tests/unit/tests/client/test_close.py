@@ -0,0 +1,55 @@
+from authelio_sdk.client import Client
+from authelio_sdk.client_user import ClientUser
+from authelio_sdk.config import Config
+from authelio_sdk_tests.unit.fixtures.stub_server import StubServer, StubResponse
+
+
+def test_FUNC_client_user_close_WITH_pool_shared_with_client_EXPECT_pool_kept(stub_server: StubServer) -> None:
+    """
+    Check whether closing a sub-client leaves the pool shared with the parent client alone.
+
+    :param stub_server: Stub server fixture.
+
+    :return: No return.
+    """
+    stub_server.route('GET', '/permission/get', lambda request: StubResponse(body={'permissions': []}))
+    client = Client('key', 'secret', Config(public_api_url=stub_server.url))
+
+    with client.user as user:
+        user.permissions('user-1')
+
+    client.group.close()
+
+    assert len(client.pool_manager.pools) == 1
+
+
+def test_FUNC_client_close_WITH_shared_pool_EXPECT_pool_cleared(stub_server: StubServer) -> None:
+    """
+    Check whether closing the client clears the pool it owns.
+
+    :param stub_server: Stub server fixture.
+
+    :return: No return.
+    """
+    stub_server.route('GET', '/permission/get', lambda request: StubResponse(body={'permissions': []}))
+
+    with Client('key', 'secret', Config(public_api_url=stub_server.url)) as client:
+        client.user.permissions('user-1')
+
+    assert len(client.pool_manager.pools) == 0
+
+
+def test_FUNC_client_user_close_WITH_own_pool_EXPECT_pool_cleared(stub_server: StubServer) -> None:
+    """
+    Check whether closing a standalone sub-client clears the pool it created.
+
+    :param stub_server: Stub server fixture.
+
+    :return: No return.
+    """
+    stub_server.route('GET', '/permission/get', lambda request: StubResponse(body={'permissions': []}))
+
+    with ClientUser('key', 'secret', Config(public_api_url=stub_server.url)) as user:
+        user.permissions('user-1')
+
+    assert len(user.pool_manager.pools) == 0
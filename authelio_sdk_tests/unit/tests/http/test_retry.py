@@ -0,0 +1,174 @@
+from typing import Dict, List
+
+import pytest
+from b_lambda_layer_common.exceptions.container.internal_error import InternalError
+
+from authelio_sdk.client_user import ClientUser
+from authelio_sdk.config import Config
+from authelio_sdk_tests.unit.fixtures.stub_server import StubServer, StubRequest, StubResponse
+
+
+@pytest.fixture(scope='function')
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """
+    Fixture that records waits between retries instead of actually waiting.
+
+    :return: Returns a list of delays the client waited for, in seconds.
+    """
+    delays: List[float] = []
+    monkeypatch.setattr('authelio_sdk.http_endpoint.time.sleep', delays.append)
+
+    return delays
+
+
+def throttle(stub_server: StubServer, headers: Dict[str, str], times: int = -1) -> None:
+    """
+    Makes the token validation route respond with 429 the given number of times
+    (always, if negative), and succeed afterwards.
+    """
+    def respond(request: StubRequest) -> StubResponse:
+        if times < 0 or stub_server.calls('/token/validate') <= times:
+            return StubResponse(status=429, headers=headers)
+
+        return StubResponse(body={'valid': True})
+
+    stub_server.route('POST', '/token/validate', respond)
+
+
+def test_FUNC_http_endpoint_call_WITH_throttled_without_retry_after_EXPECT_exponential_backoff(
+        stub_server: StubServer,
+        sleeps: List[float]
+) -> None:
+    """
+    Check whether throttled calls are retried with an exponential backoff.
+
+    :param stub_server: Stub server fixture.
+    :param sleeps: Recorded waits fixture.
+
+    :return: No return.
+    """
+    throttle(stub_server, headers={})
+    client = ClientUser('key', 'secret', Config(public_api_url=stub_server.url))
+
+    with pytest.raises(InternalError):
+        client.validate_token('token')
+
+    assert stub_server.calls('/token/validate') == 5
+    # No wait after the last attempt.
+    assert sleeps == [0.25, 0.5, 1, 2]
+
+
+@pytest.mark.parametrize('retry_after, expected_sleeps', [
+    ('1', [1, 1, 1, 2]),
+    ('2.5', [2.5, 2.5, 2.5, 2.5]),
+    ('3', [3, 3, 3, 3]),
+    ('4', [4, 4, 4, 4]),
+])
+def test_FUNC_http_endpoint_call_WITH_throttled_with_retry_after_EXPECT_all_attempts_used(
+        stub_server: StubServer,
+        sleeps: List[float],
+        retry_after: str,
+        expected_sleeps: List[float]
+) -> None:
+    """
+    Check whether Retry-After delays the attempts without reducing their number.
+
+    :param stub_server: Stub server fixture.
+    :param sleeps: Recorded waits fixture.
+    :param retry_after: Retry-After header value.
+    :param expected_sleeps: Expected waits between attempts.
+
+    :return: No return.
+    """
+    throttle(stub_server, headers={'Retry-After': retry_after})
+    client = ClientUser('key', 'secret', Config(public_api_url=stub_server.url))
+
+    with pytest.raises(InternalError):
+        client.validate_token('token')
+
+    assert stub_server.calls('/token/validate') == 5
+    assert sleeps == expected_sleeps
+
+
+@pytest.mark.parametrize('retry_after', [
+    '30',
+    'Fri, 31 Dec 2100 23:59:59 GMT',
+])
+def test_FUNC_http_endpoint_call_WITH_retry_after_above_maximum_wait_EXPECT_capped_wait(
+        stub_server: StubServer,
+        sleeps: List[float],
+        retry_after: str
+) -> None:
+    """
+    Check whether a too long requested delay is capped to the maximum single wait.
+
+    :param stub_server: Stub server fixture.
+    :param sleeps: Recorded waits fixture.
+    :param retry_after: Retry-After header value, in seconds or as an HTTP date.
+
+    :return: No return.
+    """
+    throttle(stub_server, headers={'Retry-After': retry_after})
+    client = ClientUser('key', 'secret', Config(public_api_url=stub_server.url))
+
+    with pytest.raises(InternalError):
+        client.validate_token('token')
+
+    assert stub_server.calls('/token/validate') == 5
+    assert sleeps == [4, 4, 4, 4]
+
+
+@pytest.mark.parametrize('retry_after', [
+    'Thu, 01 Jan 2015 00:00:00 GMT',
+    'not a delay',
+])
+def test_FUNC_http_endpoint_call_WITH_past_or_invalid_retry_after_EXPECT_exponential_backoff(
+        stub_server: StubServer,
+        sleeps: List[float],
+        retry_after: str
+) -> None:
+    """
+    Check whether a Retry-After in the past, or not readable, falls back to the exponential backoff.
+
+    :param stub_server: Stub server fixture.
+    :param sleeps: Recorded waits fixture.
+    :param retry_after: Retry-After header value.
+
+    :return: No return.
+    """
+    throttle(stub_server, headers={'Retry-After': retry_after})
+    client = ClientUser('key', 'secret', Config(public_api_url=stub_server.url))
+
+    with pytest.raises(InternalError):
+        client.validate_token('token')
+
+    assert stub_server.calls('/token/validate') == 5
+    assert sleeps == [0.25, 0.5, 1, 2]
+
+
+@pytest.mark.parametrize('headers, expected_sleeps', [
+    ({}, [0.25, 0.5]),
+    ({'Retry-After': '3'}, [3, 3]),
+])
+def test_FUNC_http_endpoint_call_WITH_throttled_twice_EXPECT_success(
+        stub_server: StubServer,
+        sleeps: List[float],
+        headers: Dict[str, str],
+        expected_sleeps: List[float]
+) -> None:
+    """
+    Check whether the call succeeds once the API stops throttling.
+
+    :param stub_server: Stub server fixture.
+    :param sleeps: Recorded waits fixture.
+    :param headers: Headers of throttled responses.
+    :param expected_sleeps: Expected waits between attempts.
+
+    :return: No return.
+    """
+    throttle(stub_server, headers=headers, times=2)
+    client = ClientUser('key', 'secret', Config(public_api_url=stub_server.url))
+
+    assert client.validate_token('token')
+    assert stub_server.calls('/token/validate') == 3
+    assert sleeps == expected_sleeps
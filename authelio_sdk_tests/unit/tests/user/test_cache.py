@@ -0,0 +1,397 @@
+import base64
+import time
+from typing import Any, Dict, Set
+
+import orjson
+import pytest
+
+from authelio_sdk.client import Client
+from authelio_sdk.config import Config
+from authelio_sdk_tests.unit.fixtures.stub_server import StubServer, StubRequest, StubResponse
+
+
+def jwt(exp: Any) -> str:
+    """
+    Creates an unsigned JWT with the given expiry claim.
+    """
+    def encode(data: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(orjson.dumps(data)).decode().rstrip('=')
+
+    return f'{encode({"alg": "none"})}.{encode({"exp": exp})}.signature'
+
+
+VALID_TOKEN = jwt(int(time.time()) + 3600)
+
+
+class StubUsers:
+    """
+    In-memory users and tokens served by the stub server.
+    """
+
+    def __init__(self, stub_server: StubServer) -> None:
+        self.users: Dict[str, Dict[str, Any]] = {
+            'user-1': {
+                'user_id': 'user-1',
+                'username': 'username-1',
+                'email': 'user-1@example.com',
+                'first_name': 'First',
+                'last_name': 'Last',
+                'is_active': True,
+                'direct_permissions': ['read'],
+                'group_ids': []
+            },
+            'user-2': {
+                'user_id': 'user-2',
+                'username': 'username-2',
+                'email': 'user-2@example.com',
+                'first_name': 'First',
+                'last_name': 'Last',
+                'is_active': True,
+                'direct_permissions': [],
+                'group_ids': []
+            }
+        }
+        self.valid_tokens: Set[str] = {VALID_TOKEN}
+
+        stub_server.route('GET', '/user/get', self.get)
+        stub_server.route('PUT', '/user/update', self.update)
+        stub_server.route('POST', '/user/enable', self.enable)
+        stub_server.route('POST', '/user/disable', self.disable)
+        stub_server.route('DELETE', '/user/delete', self.delete)
+        stub_server.route('GET', '/permission/get', self.permissions)
+        stub_server.route('POST', '/token/validate', self.validate_token)
+
+    def get(self, request: StubRequest) -> StubResponse:
+        return StubResponse(body={
+            user_id: self.users[user_id] for user_id in request.query.get('user_id', []) if user_id in self.users
+        })
+
+    def update(self, request: StubRequest) -> StubResponse:
+        self.users[request.body['user_id']].update(request.body)
+        return StubResponse()
+
+    def enable(self, request: StubRequest) -> StubResponse:
+        self.users[request.body['user_id']]['is_active'] = True
+        return StubResponse()
+
+    def disable(self, request: StubRequest) -> StubResponse:
+        self.users[request.body['user_id']]['is_active'] = False
+        self.valid_tokens.clear()
+        return StubResponse()
+
+    def delete(self, request: StubRequest) -> StubResponse:
+        del self.users[request.body['user_id']]
+        self.valid_tokens.clear()
+        return StubResponse()
+
+    def permissions(self, request: StubRequest) -> StubResponse:
+        return StubResponse(body={'permissions': self.users[request.query['user_id'][0]]['direct_permissions']})
+
+    def validate_token(self, request: StubRequest) -> StubResponse:
+        return StubResponse(body={'valid': request.body['access_token'] in self.valid_tokens})
+
+
+@pytest.fixture(scope='function')
+def stub_users(stub_server: StubServer) -> StubUsers:
+    """
+    Fixture that serves users and tokens from the stub server.
+
+    :return: Returns in-memory users and tokens of the stub server.
+    """
+    return StubUsers(stub_server)
+
+
+@pytest.fixture(scope='function')
+def cached_client(stub_server: StubServer) -> Client:
+    """
+    Fixture that creates an SDK client with caching enabled.
+
+    :return: Returns an SDK client calling the stub server.
+    """
+    return Client('key', 'secret', Config(public_api_url=stub_server.url, user_cache_ttl=300, token_cache_ttl=60))
+
+
+def test_FUNC_client_user_get_WITH_cache_enabled_EXPECT_api_called_once(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client
+) -> None:
+    """
+    Check whether repeated user retrieval is served from the cache, including a single cached user.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+
+    :return: No return.
+    """
+    first = cached_client.user.get('user-1')['user-1']
+    # Changes of returned users must not leak into the cache.
+    first.email = 'changed@example.com'
+    second = cached_client.user.get('user-1')['user-1']
+
+    assert second.email == 'user-1@example.com'
+    assert stub_server.calls('/user/get') == 1
+
+
+def test_FUNC_client_user_get_WITH_some_users_cached_EXPECT_missing_fetched_in_given_order(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client
+) -> None:
+    """
+    Check whether only not cached users are fetched, and users are returned in the order of given ids.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+
+    :return: No return.
+    """
+    cached_client.user.get('user-2')
+
+    users = cached_client.user.get('user-1', 'user-2', 'user-1')
+
+    assert list(users) == ['user-1', 'user-2']
+    assert stub_server.calls('/user/get') == 2
+    assert stub_server.requests[-1].query == {'user_id': ['user-1']}
+
+
+def test_FUNC_client_user_get_WITH_cache_disabled_EXPECT_api_called_every_time(
+        stub_server: StubServer,
+        stub_users: StubUsers
+) -> None:
+    """
+    Check whether nothing is cached by default.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+
+    :return: No return.
+    """
+    client = Client('key', 'secret', Config(public_api_url=stub_server.url))
+
+    client.user.get('user-1')
+    client.user.get('user-1')
+    client.user.permissions('user-1')
+    client.user.permissions('user-1')
+    client.user.validate_token(VALID_TOKEN)
+    client.user.validate_token(VALID_TOKEN)
+
+    assert stub_server.calls('/user/get') == 2
+    assert stub_server.calls('/permission/get') == 2
+    assert stub_server.calls('/token/validate') == 2
+
+
+def test_FUNC_client_user_get_WITH_user_updated_EXPECT_fresh_user_and_permissions(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client
+) -> None:
+    """
+    Check whether an update drops the cached user and permissions.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+
+    :return: No return.
+    """
+    assert cached_client.user.get('user-1')['user-1'].email == 'user-1@example.com'
+    assert cached_client.user.permissions('user-1') == ['read']
+
+    cached_client.user.update('user-1', email='new@example.com', direct_permissions=['read', 'write'])
+
+    assert cached_client.user.get('user-1')['user-1'].email == 'new@example.com'
+    assert cached_client.user.permissions('user-1') == ['read', 'write']
+    assert stub_server.calls('/user/get') == 2
+    assert stub_server.calls('/permission/get') == 2
+
+
+@pytest.mark.parametrize('method, expected_is_active', [
+    ('disable', False),
+    ('enable', True),
+])
+def test_FUNC_client_user_get_WITH_user_enabled_or_disabled_EXPECT_fresh_user(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client,
+        method: str,
+        expected_is_active: bool
+) -> None:
+    """
+    Check whether enabling or disabling a user drops the cached user.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+    :param method: Client method changing user status.
+    :param expected_is_active: User status after the change.
+
+    :return: No return.
+    """
+    stub_users.users['user-1']['is_active'] = not expected_is_active
+    assert cached_client.user.get('user-1')['user-1'].is_active is not expected_is_active
+
+    getattr(cached_client.user, method)('user-1')
+
+    assert cached_client.user.get('user-1')['user-1'].is_active is expected_is_active
+    assert stub_server.calls('/user/get') == 2
+
+
+def test_FUNC_client_user_validate_token_WITH_cache_enabled_EXPECT_only_valid_tokens_cached(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client
+) -> None:
+    """
+    Check whether only positive token validation results are cached.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+
+    :return: No return.
+    """
+    assert cached_client.user.validate_token(VALID_TOKEN)
+    assert cached_client.user.validate_token(VALID_TOKEN)
+    assert stub_server.calls('/token/validate') == 1
+
+    assert not cached_client.user.validate_token('invalid-token')
+    assert not cached_client.user.validate_token('invalid-token')
+    assert stub_server.calls('/token/validate') == 3
+
+
+@pytest.mark.parametrize('method', ['delete', 'disable'])
+def test_FUNC_client_user_validate_token_WITH_user_deleted_or_disabled_EXPECT_cached_tokens_dropped(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client,
+        method: str
+) -> None:
+    """
+    Check whether deleting or disabling a user drops cached token validation results.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+    :param method: Client method deleting or disabling a user.
+
+    :return: No return.
+    """
+    assert cached_client.user.validate_token(VALID_TOKEN)
+
+    getattr(cached_client.user, method)('user-1')
+
+    assert not cached_client.user.validate_token(VALID_TOKEN)
+    assert stub_server.calls('/token/validate') == 2
+
+
+@pytest.mark.parametrize('api_key, api_secret', [
+    ('other-key', 'secret'),
+    ('key', 'other-secret'),
+])
+def test_FUNC_client_user_get_WITH_different_api_keys_EXPECT_cache_not_shared(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client,
+        api_key: str,
+        api_secret: str
+) -> None:
+    """
+    Check whether cached entries are not shared between different API keys,
+    or the same API key with a different secret.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+    :param api_key: API key of the other client.
+    :param api_secret: API secret of the other client.
+
+    :return: No return.
+    """
+    other_client = Client(
+        api_key,
+        api_secret,
+        Config(public_api_url=stub_server.url, user_cache_ttl=300, token_cache_ttl=60)
+    )
+
+    cached_client.user.get('user-1')
+    cached_client.user.permissions('user-1')
+    cached_client.user.validate_token(VALID_TOKEN)
+    other_client.user.get('user-1')
+    other_client.user.permissions('user-1')
+    other_client.user.validate_token(VALID_TOKEN)
+
+    assert stub_server.calls('/user/get') == 2
+    assert stub_server.calls('/permission/get') == 2
+    assert stub_server.calls('/token/validate') == 2
+
+    # Both clients are served from their own cache entries now.
+    cached_client.user.get('user-1')
+    other_client.user.get('user-1')
+
+    assert stub_server.calls('/user/get') == 2
+
+
+@pytest.mark.parametrize('access_token', [
+    'not-a-jwt',
+    jwt('not-a-number'),
+    jwt(int(time.time()) - 10),
+])
+def test_FUNC_client_user_validate_token_WITH_unknown_or_past_expiry_EXPECT_not_cached(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client,
+        access_token: str
+) -> None:
+    """
+    Check whether a validation result is not cached, when the token expiry can not be read or has passed.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+    :param access_token: Access token considered valid by the API.
+
+    :return: No return.
+    """
+    stub_users.valid_tokens.add(access_token)
+
+    assert cached_client.user.validate_token(access_token)
+    assert cached_client.user.validate_token(access_token)
+    assert stub_server.calls('/token/validate') == 2
+
+
+def test_FUNC_client_user_validate_token_WITH_token_expiring_before_cache_ttl_EXPECT_cached_until_expiry(
+        stub_server: StubServer,
+        stub_users: StubUsers,
+        cached_client: Client,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Check whether a validation result is cached only until the token expires, not for the whole cache ttl.
+
+    :param stub_server: Stub server fixture.
+    :param stub_users: Stub users fixture.
+    :param cached_client: SDK client fixture.
+
+    :return: No return.
+    """
+    now = [1000.0]
+    monkeypatch.setattr('authelio_sdk.client_user.time.time', lambda: now[0])
+    monkeypatch.setattr('authelio_sdk.cache.time.monotonic', lambda: now[0])
+
+    # Token expires in 10 seconds, while the cache ttl is 60 seconds.
+    access_token = jwt(int(now[0]) + 10)
+    stub_users.valid_tokens.add(access_token)
+
+    assert cached_client.user.validate_token(access_token)
+    now[0] += 9
+    assert cached_client.user.validate_token(access_token)
+    assert stub_server.calls('/token/validate') == 1
+
+    # The token expired.
+    now[0] += 2
+    stub_users.valid_tokens.remove(access_token)
+    assert not cached_client.user.validate_token(access_token)
+    assert stub_server.calls('/token/validate') == 2
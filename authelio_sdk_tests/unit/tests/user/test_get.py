@@ -0,0 +1,35 @@
+from authelio_sdk.client import Client
+from authelio_sdk.config import Config
+from authelio_sdk_tests.unit.fixtures.stub_server import StubServer, StubRequest, StubResponse
+
+
+def test_FUNC_client_user_get_WITH_duplicate_ids_EXPECT_each_id_sent_once(stub_server: StubServer) -> None:
+    """
+    Check whether duplicate user ids are sent to the API only once, in a single call.
+
+    :param stub_server: Stub server fixture.
+
+    :return: No return.
+    """
+    def get(request: StubRequest) -> StubResponse:
+        return StubResponse(body={
+            user_id: {
+                'user_id': user_id,
+                'username': f'username-{user_id}',
+                'email': f'{user_id}@example.com',
+                'first_name': 'First',
+                'last_name': 'Last',
+                'is_active': True,
+                'direct_permissions': [],
+                'group_ids': []
+            } for user_id in request.query['user_id']
+        })
+
+    stub_server.route('GET', '/user/get', get)
+    client = Client('key', 'secret', Config(public_api_url=stub_server.url))
+
+    users = client.user.get('a', 'b', 'a')
+
+    assert list(users) == ['a', 'b']
+    assert stub_server.calls('/user/get') == 1
+    assert stub_server.requests[-1].query == {'user_id': ['a', 'b']}
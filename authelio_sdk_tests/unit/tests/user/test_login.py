@@ -0,0 +1,23 @@
+from authelio_sdk.client import Client
+from authelio_sdk.config import Config
+from authelio_sdk_tests.unit.fixtures.stub_server import StubServer, StubResponse
+
+
+def test_FUNC_client_user_login_WITH_redirect_response_EXPECT_location_returned(stub_server: StubServer) -> None:
+    """
+    Check whether the hosted login page URL is taken from the redirect, without following it.
+
+    :param stub_server: Stub server fixture.
+
+    :return: No return.
+    """
+    login_url = 'https://login.example.com/login?client_id=client'
+    stub_server.route('GET', '/login', lambda request: StubResponse(status=302, headers={'Location': login_url}))
+    client = Client('key', 'secret', Config(public_api_url=stub_server.url))
+
+    response = client.user.login(redirect_uri='https://example.com', response_type='code')
+
+    assert response == login_url
+    assert stub_server.requests[-1].query == {'redirect_uri': ['https://example.com'], 'response_type': ['code']}
+    # The call went through the shared pool.
+    assert len(client.pool_manager.pools) == 1
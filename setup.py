@@ -25,6 +25,7 @@ setup(
     include_package_data=True,
     install_requires=[
         'b_lambda_layer_common>=4.2.2,<5.0.0',
+        'orjson>=3.6.0,<4.0.0',
         'urllib3>=1.26.0,<2.0.0'
     ],
     author='Gediminas Kazlauskas',